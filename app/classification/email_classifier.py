@@ -1,50 +1,171 @@
 """Email classification functionality"""
 
+import hashlib
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from job_application_tracker.config.settings import Settings
 from job_application_tracker.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_QUANTIFIERS = '?*{'
+
+# Escapes whose argument is a fixed number of characters after the letter
+_ESCAPE_LENGTHS = {'x': 2, 'u': 4, 'U': 8}
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters
+_IGNORECASE_FOLDS = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """Longest run of letters every match of pattern must contain, if any
+    
+    Only letters outside groups and character classes are considered.
+    Patterns with a top-level alternation, or with an escape inside a
+    character class, are reported as having no required literal.
+    """
+    runs = []
+    run = ''
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if depth == 0 and char.isascii() and char.isalpha():
+            run += char
+            i += 1
+            continue
+        
+        # The quantifier makes the last letter of the run optional
+        runs.append(run[:-1] if char in _QUANTIFIERS else run)
+        run = ''
+        if char == '\\':
+            escape = pattern[i + 1]
+            if escape == 'N':
+                # Named character, e.g. \N{LATIN SMALL LETTER E}
+                i = pattern.index('}', i)
+            else:
+                i += 1 + _ESCAPE_LENGTHS.get(escape, 0)
+        elif char == '[':
+            # Skip the class; a leading ']' (after an optional '^') is literal
+            i += 1
+            if pattern[i] == '^':
+                i += 1
+            if pattern[i] == ']':
+                i += 1
+            while pattern[i] != ']':
+                # Escapes such as \] make the class end ambiguous to this scanner
+                if pattern[i] == '\\':
+                    return None
+                i += 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return None
+        i += 1
+    runs.append(run)
+    
+    longest = max(runs, key=len)
+    return longest.lower() or None
+
 class EmailClassifier:
     """Classifies emails based on content patterns"""
     
     def __init__(self):
         self.patterns = Settings.EMAIL_PATTERNS
+        self._cache: Dict[bytes, str] = {}
+        self._build_regexes()
     
-    def classify_email(self, subject: str, body: str) -> str:
-        """Classify email based on content"""
-        content = f"{subject} {body}".lower()
+    def classify_email(self, content: str) -> str:
+        """Classify email based on its subject and body joined into one string
         
-        # Check each category
-        for category, patterns in self.patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    logger.debug(f"Email classified as '{category}' based on pattern: {pattern}")
-                    return category
+        Results are cached by a digest of the content, since templated emails
+        from applicant tracking systems often repeat verbatim.
+        """
+        key = hashlib.blake2b(content.encode('utf-8', errors='surrogatepass')).digest()
+        category = self._cache.get(key)
+        if category is None:
+            category = self._match_category(content)
+            if len(self._cache) >= Settings.CLASSIFICATION_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = category
         
-        logger.debug("Email could not be classified, returning 'unknown'")
-        return 'unknown'
+        return category
+    
+    def classify_subject(self, subject: str) -> Optional[str]:
+        """Classify from the subject alone if the body cannot change the result
+        
+        Only the first category is conclusive, since a body match for an
+        earlier category would otherwise take precedence.
+        """
+        category = self.classify_email(subject)
+        if category == next(iter(self.patterns), None):
+            return category
+        return None
     
     def classify_applications(self, applications: List[Dict]) -> List[Dict]:
         """Classify a list of applications"""
         for application in applications:
-            application['status'] = self.classify_email(
-                application['subject'], 
-                application.get('body', '')
-            )
+            content = application['subject']
+            body = application.get('body', '')
+            if body:
+                content = f"{content} {body}"
+            application['status'] = self.classify_email(content)
         
         return applications
     
     def add_pattern(self, category: str, pattern: str) -> None:
         """Add a new classification pattern"""
+        # Validate before touching the shared patterns
+        try:
+            re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern '{pattern}': {e}") from e
+        
         if category not in self.patterns:
             self.patterns[category] = []
         self.patterns[category].append(pattern)
+        self._build_regexes()
+        self._cache.clear()
         logger.info(f"Added pattern '{pattern}' to category '{category}'")
     
     def get_categories(self) -> List[str]:
         """Get all available categories"""
-        return list(self.patterns.keys())
\ No newline at end of file
+        return list(self.patterns.keys())
+    
+    def _build_regexes(self) -> None:
+        """Compile every pattern once and collect prescreen literals
+        
+        The required literal of every pattern is collected for the prescreen;
+        if any pattern lacks one, the prescreen is disabled.
+        """
+        self.compiled: List[Tuple[str, List[re.Pattern]]] = [
+            (category, [re.compile(pattern, re.IGNORECASE) for pattern in patterns])
+            for category, patterns in self.patterns.items()
+        ]
+        
+        literals = {_required_literal(pattern) for patterns in self.patterns.values() for pattern in patterns}
+        self.literals = None if None in literals else sorted(literals)
+    
+    def _match_category(self, content: str) -> str:
+        """Check content against each category in order"""
+        # Cheap substring prescreen: without any required literal, no pattern can match
+        if self.literals is not None:
+            if content.isascii():
+                lowered = content.lower()
+            else:
+                lowered = content.translate(_IGNORECASE_FOLDS).lower()
+            if not any(literal in lowered for literal in self.literals):
+                logger.debug("Email could not be classified, returning 'unknown'")
+                return 'unknown'
+        
+        for category, patterns in self.compiled:
+            for pattern in patterns:
+                if pattern.search(content):
+                    logger.debug("Email classified as '%s' based on pattern: %s", category, pattern.pattern)
+                    return category
+        
+        logger.debug("Email could not be classified, returning 'unknown'")
+        return 'unknown'
@@ -17,6 +17,10 @@ class Settings:
     
     # Email search settings
     MAX_SEARCH_RESULTS = 100
+    GMAIL_BATCH_SIZE = 50  # Larger Gmail batches get rate limited
+    GMAIL_BATCH_RETRIES = 3  # Retries for rate-limited or failed batch parts
+    GMAIL_METADATA_HEADERS = ['Subject', 'From', 'Date']
+    MAX_BODY_CHARS = 16384  # Enough body text for classification
     
     # Excel column headers
     EXCEL_HEADERS = [
@@ -59,6 +63,9 @@ class Settings:
         ]
     }
     
+    # Number of classified email contents to remember
+    CLASSIFICATION_CACHE_SIZE = 1024
+    
     # Gmail search terms
     SEARCH_TERMS = [
         '"thanks for applying"',
@@ -72,7 +79,7 @@ class Settings:
     ]
     
     # Email providers to exclude from company extraction
-    COMMON_EMAIL_PROVIDERS = [
+    COMMON_EMAIL_PROVIDERS = frozenset({
         'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
         'icloud.com', 'aol.com', 'protonmail.com'
-    ]
+    })
@@ -1,9 +1,11 @@
 """Excel spreadsheet handling for job application tracking"""
 
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Optional, Set
 
+import orjson
 from openpyxl import Workbook, load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
 
@@ -20,16 +22,43 @@ class ExcelTracker:
         self.sheet_name = Settings.DEFAULT_SHEET_NAME
         self.headers = Settings.EXCEL_HEADERS
     
+    @property
+    def excel_path(self) -> Path:
+        """Path of the tracked Excel file"""
+        return self._excel_path
+    
+    @excel_path.setter
+    def excel_path(self, value: Path) -> None:
+        self._excel_path = Path(value)
+        # Message IDs cached for the previous file no longer apply
+        self._known_ids: Optional[Set[str]] = None
+        self._known_ids_mtime: Optional[float] = None
+    
     def update_applications(self, applications: List[Dict[str, Any]]) -> bool:
         """Update Excel sheet with application data"""
         try:
+            known_ids = self._get_known_message_ids()
+            if self.excel_path.exists() and all(app['message_id'] in known_ids for app in applications):
+                logger.info("Excel updated: 0 new applications added")
+                return True
+            
+            now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             wb, ws = self._get_or_create_workbook()
-            self._ensure_headers(ws)
+            if not wb.write_only:
+                self._ensure_headers(ws)
+            added_count = self._add_new_applications(ws, applications, known_ids, now_str)
             
-            existing_message_ids = self._get_existing_message_ids(ws)
-            added_count = self._add_new_applications(ws, applications, existing_message_ids)
+            if wb.write_only:
+                # A new file holds exactly the rows just appended
+                statuses = [app['status'] for app in applications if app['status']]
+                status_counts, total_applications = dict(Counter(statuses)), len(statuses)
+            else:
+                status_counts, total_applications = self._count_applications_by_status(ws)
             
             wb.save(self.excel_path)
+            known_ids.update(app['message_id'] for app in applications)
+            self._known_ids_mtime = self.excel_path.stat().st_mtime
+            self._write_summary_sidecar(status_counts, total_applications)
             logger.info(f"Excel updated: {added_count} new applications added")
             return True
             
@@ -43,12 +72,21 @@ class ExcelTracker:
             if not self.excel_path.exists():
                 return {"error": f"Excel file not found: {self.excel_path}"}
             
-            wb = load_workbook(self.excel_path)
-            if self.sheet_name not in wb.sheetnames:
-                return {"error": f"No {self.sheet_name} sheet found in Excel file"}
-            
-            ws = wb[self.sheet_name]
-            status_counts, total_applications = self._count_applications_by_status(ws)
+            summary = self._read_summary_sidecar()
+            if summary:
+                status_counts = summary["status_counts"]
+                total_applications = summary["total_applications"]
+            else:
+                wb = load_workbook(self.excel_path, read_only=True, data_only=True)
+                try:
+                    if self.sheet_name not in wb.sheetnames:
+                        return {"error": f"No {self.sheet_name} sheet found in Excel file"}
+                    
+                    ws = wb[self.sheet_name]
+                    status_counts, total_applications = self._count_applications_by_status(ws)
+                finally:
+                    wb.close()
+                self._write_summary_sidecar(status_counts, total_applications)
             
             if total_applications == 0:
                 return {"error": "No applications found in Excel file"}
@@ -63,8 +101,38 @@ class ExcelTracker:
             logger.error(f"Error reading Excel summary: {e}")
             return {"error": f"Error reading Excel file: {str(e)}"}
     
+    @property
+    def summary_path(self) -> Path:
+        """Path of the JSON sidecar caching the status summary"""
+        return self.excel_path.with_suffix('.summary.json')
+    
+    def _read_summary_sidecar(self) -> Optional[Dict[str, Any]]:
+        """Read the cached summary, unless it is missing or older than the Excel file"""
+        try:
+            if self.summary_path.stat().st_mtime_ns < self.excel_path.stat().st_mtime_ns:
+                return None
+            return orjson.loads(self.summary_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+    
+    def _write_summary_sidecar(self, status_counts: Dict[str, int], total_applications: int) -> None:
+        """Cache the status summary next to the Excel file"""
+        summary = {
+            "total_applications": total_applications,
+            "status_counts": status_counts,
+            "updated_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        try:
+            self.summary_path.write_bytes(orjson.dumps(summary))
+        except OSError as e:
+            logger.warning(f"Could not write summary file {self.summary_path}: {e}")
+    
     def _get_or_create_workbook(self) -> tuple[Workbook, Worksheet]:
-        """Get existing workbook or create new one"""
+        """Get existing workbook or create new one
+        
+        New workbooks are opened in write-only mode with the header row
+        already appended, so rows can be streamed in with ws.append.
+        """
         if self.excel_path.exists():
             wb = load_workbook(self.excel_path)
             if self.sheet_name in wb.sheetnames:
@@ -72,9 +140,9 @@ class ExcelTracker:
             else:
                 ws = wb.create_sheet(self.sheet_name)
         else:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = self.sheet_name
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(self.sheet_name)
+            ws.append(self.headers)
         
         return wb, ws
     
@@ -84,52 +152,69 @@ class ExcelTracker:
             for col, header in enumerate(self.headers, 1):
                 ws.cell(row=1, column=col, value=header)
     
+    def _get_known_message_ids(self) -> Set[str]:
+        """Get cached message IDs, re-reading the sheet if the file changed on disk"""
+        if not self.excel_path.exists():
+            self._known_ids, self._known_ids_mtime = set(), None
+            return self._known_ids
+        
+        mtime = self.excel_path.stat().st_mtime
+        if self._known_ids is None or mtime != self._known_ids_mtime:
+            wb = load_workbook(self.excel_path, read_only=True)
+            try:
+                if self.sheet_name in wb.sheetnames:
+                    self._known_ids = self._get_existing_message_ids(wb[self.sheet_name])
+                else:
+                    self._known_ids = set()
+            finally:
+                wb.close()
+            self._known_ids_mtime = mtime
+        
+        return self._known_ids
+    
     def _get_existing_message_ids(self, ws: Worksheet) -> Set[str]:
         """Get set of existing message IDs to avoid duplicates"""
-        existing_message_ids = set()
         message_id_col = 7  # Message ID column
         
-        for row in range(2, ws.max_row + 1):
-            message_id = ws.cell(row=row, column=message_id_col).value
-            if message_id:
-                existing_message_ids.add(message_id)
-        
-        return existing_message_ids
+        return {
+            message_id
+            for (message_id,) in ws.iter_rows(
+                min_row=2, min_col=message_id_col, max_col=message_id_col, values_only=True
+            )
+            if message_id
+        }
     
     def _add_new_applications(self, ws: Worksheet, applications: List[Dict[str, Any]], 
-                            existing_message_ids: Set[str]) -> int:
+                            existing_message_ids: Set[str], now_str: str) -> int:
         """Add new applications to the worksheet"""
         added_count = 0
         
         for app in applications:
             if app['message_id'] not in existing_message_ids:
-                row = ws.max_row + 1
-                self._write_application_row(ws, row, app)
+                ws.append((
+                    app['company'],
+                    app['position'],
+                    app['status'],
+                    app['date'],
+                    app['subject'],
+                    app['sender'],
+                    app['message_id'],
+                    now_str
+                ))
                 added_count += 1
         
         return added_count
     
-    def _write_application_row(self, ws: Worksheet, row: int, app: Dict[str, Any]) -> None:
-        """Write application data to a specific row"""
-        ws.cell(row=row, column=1, value=app['company'])
-        ws.cell(row=row, column=2, value=app['position'])
-        ws.cell(row=row, column=3, value=app['status'])
-        ws.cell(row=row, column=4, value=app['date'])
-        ws.cell(row=row, column=5, value=app['subject'])
-        ws.cell(row=row, column=6, value=app['sender'])
-        ws.cell(row=row, column=7, value=app['message_id'])
-        ws.cell(row=row, column=8, value=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-    
     def _count_applications_by_status(self, ws: Worksheet) -> tuple[Dict[str, int], int]:
         """Count applications by status"""
-        status_counts = {}
-        total_applications = 0
         status_col = 3  # Status column
         
-        for row in range(2, ws.max_row + 1):
-            status = ws.cell(row=row, column=status_col).value
-            if status:
-                total_applications += 1
-                status_counts[status] = status_counts.get(status, 0) + 1
+        statuses = [
+            status
+            for (status,) in ws.iter_rows(
+                min_row=2, min_col=status_col, max_col=status_col, values_only=True
+            )
+            if status
+        ]
         
-        return status_counts, total_applications
\ No newline at end of file
+        return dict(Counter(statuses)), len(statuses)
\ No newline at end of file
@@ -1,18 +1,35 @@
 """Gmail authentication handling"""
 
+import asyncio
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
 
 from job_application_tracker.config.settings import Settings
 from job_application_tracker.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+class OrjsonModel(JsonModel):
+    """JSON model that decodes Gmail API responses with orjson"""
+    
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Match JsonModel, which hands back undecodable content as text
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
 class GmailAuthenticator:
     """Handles Gmail API authentication"""
     
@@ -21,40 +38,31 @@ class GmailAuthenticator:
         self.credentials_path = Path(Settings.CREDENTIALS_FILE)
         self.token_path = Path(Settings.TOKEN_FILE)
         self._service = None
+        # Serializes use of the shared Gmail HTTP connection, which is not thread-safe
+        self.lock = asyncio.Lock()
     
     async def authenticate(self) -> bool:
         """Authenticate with Gmail API"""
+        async with self.lock:
+            return await self._authenticate()
+    
+    async def ensure_authenticated(self) -> bool:
+        """Authenticate unless a previous or concurrent call already has"""
+        async with self.lock:
+            if self._service is not None:
+                return True
+            return await self._authenticate()
+    
+    async def _authenticate(self) -> bool:
+        """Build the Gmail service; the caller must hold self.lock"""
         try:
-            creds = None
-            
-            # Load existing token
-            if self.token_path.exists():
-                creds = Credentials.from_authorized_user_file(
-                    str(self.token_path), self.scopes
-                )
+            # Token refresh, the OAuth flow and discovery all block on I/O
+            loop = asyncio.get_running_loop()
+            service = await loop.run_in_executor(None, self._build_service)
+            if service is None:
+                return False
             
-            # If no valid credentials, get new ones
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                else:
-                    if not self.credentials_path.exists():
-                        logger.error(
-                            f"Credentials file not found: {self.credentials_path}. "
-                            "Please download from Google Cloud Console."
-                        )
-                        return False
-                    
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        str(self.credentials_path), self.scopes
-                    )
-                    creds = flow.run_local_server(port=0)
-                
-                # Save credentials for next run
-                with open(self.token_path, 'w') as token:
-                    token.write(creds.to_json())
-            
-            self._service = build('gmail', 'v1', credentials=creds)
+            self._service = service
             logger.info("Gmail authentication successful")
             return True
             
@@ -62,6 +70,39 @@ class GmailAuthenticator:
             logger.error(f"Gmail authentication failed: {e}")
             return False
     
+    def _build_service(self):
+        """Load or obtain credentials and build the Gmail service"""
+        creds = None
+        
+        # Load existing token
+        if self.token_path.exists():
+            creds = Credentials.from_authorized_user_file(
+                str(self.token_path), self.scopes
+            )
+        
+        # If no valid credentials, get new ones
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                if not self.credentials_path.exists():
+                    logger.error(
+                        f"Credentials file not found: {self.credentials_path}. "
+                        "Please download from Google Cloud Console."
+                    )
+                    return None
+                
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    str(self.credentials_path), self.scopes
+                )
+                creds = flow.run_local_server(port=0)
+            
+            # Save credentials for next run
+            with open(self.token_path, 'w') as token:
+                token.write(creds.to_json())
+        
+        return build('gmail', 'v1', credentials=creds, model=OrjsonModel())
+    
     @property
     def service(self):
         """Get the Gmail service instance"""
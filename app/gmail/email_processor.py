@@ -1,29 +1,41 @@
 """Gmail email processing functionality"""
 
+import asyncio
 import base64
 import re
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List, Optional
 
+import httplib2
 from googleapiclient.errors import HttpError
 
+from job_application_tracker.classification.email_classifier import EmailClassifier
 from job_application_tracker.config.settings import Settings
 from job_application_tracker.gmail.auth import GmailAuthenticator
 from job_application_tracker.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Common position patterns in subjects. Lazy captures followed by a suffix are
+# bounded so a long subject cannot trigger excessive backtracking
+_POSITION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(?:for\s{1,3}(?:the\s{1,3})?)?(?:position\s{1,3}of\s{1,3})?\b([a-zA-Z][a-zA-Z ]{0,59}?)(?:\s{1,3}position|\s{1,3}role|\s{1,3}at|\s{1,3}-)',
+    r'(?:role:\s{0,3}|position:\s{0,3})([a-zA-Z ]+)',
+    r'application\s{1,3}for\s{1,3}\b([a-zA-Z][a-zA-Z ]{0,59}?)(?:\s{1,3}at|\s{1,3}-|\s{1,3}position)',
+])
+
 class EmailProcessor:
     """Processes Gmail emails for job application tracking"""
     
-    def __init__(self, authenticator: GmailAuthenticator):
+    def __init__(self, authenticator: GmailAuthenticator, classifier: Optional[EmailClassifier] = None):
         self.authenticator = authenticator
+        self.classifier = classifier
     
     async def search_application_emails(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """Search Gmail for job application related emails"""
-        if not self.authenticator.is_authenticated:
-            if not await self.authenticator.authenticate():
-                return []
+        if not await self.authenticator.ensure_authenticated():
+            return []
         
         try:
             # Convert dates to Gmail search format
@@ -35,20 +47,27 @@ class EmailProcessor:
             logger.info(f"Searching Gmail with query: {query}")
             
             # Search for messages
-            results = self.authenticator.service.users().messages().list(
-                userId='me',
-                q=query,
-                maxResults=Settings.MAX_SEARCH_RESULTS
-            ).execute()
+            results = await self._execute(
+                self.authenticator.service.users().messages().list(
+                    userId='me',
+                    q=query,
+                    maxResults=Settings.MAX_SEARCH_RESULTS
+                ).execute
+            )
             
             messages = results.get('messages', [])
             logger.info(f"Found {len(messages)} potential job application emails")
             
+            fetched = await self._fetch_application_messages([message['id'] for message in messages])
             applications = []
             
             for message in messages:
+                msg = fetched.get(message['id'])
+                if msg is None:
+                    continue
+                
                 try:
-                    application = await self._process_message(message['id'])
+                    application = self._parse_message(msg)
                     if application:
                         applications.append(application)
                         logger.info(f"Processed: {application['company']} - {application['status']}")
@@ -69,20 +88,111 @@ class EmailProcessor:
         date_range = f"after:{start_dt.strftime('%Y/%m/%d')} before:{end_dt.strftime('%Y/%m/%d')}"
         return f"({' OR '.join(query_terms)}) {date_range}"
     
-    async def _process_message(self, message_id: str) -> Dict[str, Any]:
-        """Process a single Gmail message"""
-        # Get full message details
-        msg = self.authenticator.service.users().messages().get(
-            userId='me',
-            id=message_id,
-            format='full'
-        ).execute()
+    async def _fetch_application_messages(self, message_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch messages, downloading bodies only where the subject is inconclusive"""
+        if self.classifier is None:
+            return await self._fetch_messages(message_ids, 'full')
+        
+        fetched = await self._fetch_messages(message_ids, 'metadata')
+        needs_body = [
+            message_id for message_id, msg in fetched.items()
+            if not self.classifier.classify_subject(
+                self._get_header_value(msg['payload'].get('headers', []), 'Subject')
+            )
+        ]
+        logger.info(f"Fetching full content for {len(needs_body)} of {len(fetched)} emails")
+        
+        if needs_body:
+            full = await self._fetch_messages(needs_body, 'full')
+            for message_id in needs_body:
+                # Drop messages whose body could not be fetched so a later scan retries them
+                if message_id in full:
+                    fetched[message_id] = full[message_id]
+                else:
+                    fetched.pop(message_id)
+        return fetched
+    
+    async def _fetch_messages(self, message_ids: List[str], message_format: str) -> Dict[str, Dict[str, Any]]:
+        """Fetch message details using Gmail batch requests
+        
+        Batches run one after another in the default executor. Parts
+        or whole batches that are rate limited or hit a server or network
+        error are retried in a new batch with exponential backoff.
+        """
+        service = self.authenticator.service
+        get_kwargs = {'userId': 'me', 'format': message_format}
+        if message_format == 'metadata':
+            get_kwargs['metadataHeaders'] = Settings.GMAIL_METADATA_HEADERS
+        fetched = {}
+        pending = message_ids
+        
+        for attempt in range(Settings.GMAIL_BATCH_RETRIES + 1):
+            if attempt:
+                delay = 2 ** (attempt - 1)
+                logger.warning(f"Retrying {len(pending)} message fetches in {delay}s")
+                await asyncio.sleep(delay)
+            
+            retry = []
+            can_retry = attempt < Settings.GMAIL_BATCH_RETRIES
+            
+            def on_response(request_id: str, response: Dict[str, Any], exception: Exception) -> None:
+                if exception is None:
+                    fetched[request_id] = response
+                elif can_retry and self._is_retryable(exception):
+                    retry.append(request_id)
+                else:
+                    logger.error(f"Error fetching message {request_id}: {exception}")
+            
+            for start in range(0, len(pending), Settings.GMAIL_BATCH_SIZE):
+                chunk = pending[start:start + Settings.GMAIL_BATCH_SIZE]
+                batch = service.new_batch_http_request(callback=on_response)
+                for message_id in chunk:
+                    batch.add(
+                        service.users().messages().get(id=message_id, **get_kwargs),
+                        request_id=message_id
+                    )
+                
+                try:
+                    await self._execute(batch.execute)
+                except Exception as e:
+                    # The batch request itself failed; keep what was fetched so far
+                    if can_retry and self._is_retryable(e):
+                        retry.extend(message_id for message_id in chunk if message_id not in fetched)
+                    else:
+                        logger.error(f"Error fetching batch of {len(chunk)} messages: {e}")
+            
+            if not retry:
+                break
+            pending = retry
+        
+        return fetched
+    
+    async def _execute(self, call: Callable[[], Any]) -> Any:
+        """Run a blocking Gmail call in the default executor
         
+        The service shares a single httplib2 connection, which is not
+        thread-safe, so calls from concurrent scans are serialized.
+        """
+        async with self.authenticator.lock:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, call)
+    
+    @staticmethod
+    def _is_retryable(exception: Exception) -> bool:
+        """Whether a fetch failed due to rate limiting, a server or a network error"""
+        if isinstance(exception, HttpError):
+            status = exception.resp.status
+            return status == 429 or status >= 500
+        return isinstance(exception, (OSError, httplib2.HttpLib2Error))
+    
+    def _parse_message(self, msg: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a fetched Gmail message into application data"""
         # Extract headers
-        headers = msg['payload'].get('headers', [])
-        subject = self._get_header_value(headers, 'Subject')
-        sender = self._get_header_value(headers, 'From')
-        date_header = self._get_header_value(headers, 'Date')
+        # Iterate in reverse so the first occurrence of a repeated header wins
+        headers = {h['name']: h['value'] for h in reversed(msg['payload'].get('headers', []))}
+        subject = headers.get('Subject', '')
+        sender = headers.get('From', '')
+        date_header = headers.get('Date', '')
         
         # Extract body
         body = self._extract_email_body(msg['payload'])
@@ -101,7 +211,7 @@ class EmailProcessor:
             'subject': subject,
             'sender': sender,
             'body': body,
-            'message_id': message_id
+            'message_id': msg['id']
         }
     
     def _get_header_value(self, headers: List[Dict], name: str) -> str:
@@ -109,31 +219,39 @@ class EmailProcessor:
         return next((h['value'] for h in headers if h['name'] == name), '')
     
     def _extract_email_body(self, payload: Dict) -> str:
-        """Extract text body from email payload"""
-        body = ""
-        
-        if 'parts' in payload:
-            for part in payload['parts']:
-                if part['mimeType'] == 'text/plain':
-                    data = part['body'].get('data', '')
-                    if data:
-                        body += base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-                elif part['mimeType'] == 'multipart/alternative':
-                    body += self._extract_email_body(part)
-        else:
-            if payload['mimeType'] == 'text/plain':
-                data = payload['body'].get('data', '')
+        """Extract text body from email payload
+        
+        Parts are walked iteratively in document order and extraction stops
+        once MAX_BODY_CHARS of text has been collected for classification.
+        """
+        chunks = []
+        total = 0
+        pending = deque([payload])
+        
+        while pending:
+            part = pending.popleft()
+            if part.get('mimeType') == 'text/plain':
+                # Metadata-only messages carry no body data
+                data = part.get('body', {}).get('data', '')
                 if data:
-                    body += base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
+                    chunk = base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= Settings.MAX_BODY_CHARS:
+                        break
+            elif 'parts' in part:
+                pending.extendleft(reversed(part['parts']))
         
-        return body
+        return "".join(chunks)
     
     def _extract_company_info(self, sender: str, subject: str, body: str) -> Dict[str, str]:
         """Extract company name and position from email"""
         # Extract company from sender email domain
         company = "Unknown"
-        if '@' in sender:
-            domain = sender.split('@')[1].lower()
+        _, at, tail = sender.rpartition('@')
+        if at:
+            # Drop the closing bracket of "Name <user@host>" senders
+            domain = tail.split('>')[0].strip().lower()
             # Remove common email providers
             if domain not in Settings.COMMON_EMAIL_PROVIDERS:
                 company = domain.split('.')[0].title()
@@ -150,15 +268,8 @@ class EmailProcessor:
         """Extract position from email subject"""
         position = "Unknown"
         
-        # Common position patterns in subjects
-        position_patterns = [
-            r'(?:for\s+(?:the\s+)?)?(?:position\s+of\s+)?([a-zA-Z\s]+?)(?:\s+position|\s+role|\s+at|\s+-)',
-            r'(?:role:\s*|position:\s*)([a-zA-Z\s]+)',
-            r'application\s+for\s+([a-zA-Z\s]+?)(?:\s+at|\s+-|\s+position)',
-        ]
-        
-        for pattern in position_patterns:
-            match = re.search(pattern, subject, re.IGNORECASE)
+        for pattern in _POSITION_PATTERNS:
+            match = pattern.search(subject)
             if match:
                 position = match.group(1).strip().title()
                 break
@@ -1,7 +1,9 @@
 """MCP server implementation for job application tracking"""
 
 import asyncio
-from typing import List
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List
 
 import mcp.server.stdio
 import mcp.types as types
@@ -22,9 +24,10 @@ class JobApplicationMCPServer:
     def __init__(self):
         self.server = Server("job-application-tracker")
         self.authenticator = GmailAuthenticator()
-        self.email_processor = EmailProcessor(self.authenticator)
         self.classifier = EmailClassifier()
+        self.email_processor = EmailProcessor(self.authenticator, self.classifier)
         self.excel_tracker = ExcelTracker()
+        self._trackers: Dict[str, ExcelTracker] = {str(self.excel_tracker.excel_path): self.excel_tracker}
         
         self._register_handlers()
     
@@ -97,7 +100,7 @@ class JobApplicationMCPServer:
         try:
             # Update excel tracker path if provided
             if excel_path:
-                self.excel_tracker = ExcelTracker(excel_path)
+                self.excel_tracker = self._get_tracker(excel_path)
             
             # Search for applications
             applications = await self.email_processor.search_application_emails(start_date, end_date)
@@ -136,7 +139,7 @@ class JobApplicationMCPServer:
         
         try:
             if excel_path:
-                excel_tracker = ExcelTracker(excel_path)
+                excel_tracker = self._get_tracker(excel_path)
             else:
                 excel_tracker = self.excel_tracker
             
@@ -158,12 +161,16 @@ class JobApplicationMCPServer:
                 text=f"Error reading Excel file: {str(e)}"
             )]
     
+    def _get_tracker(self, excel_path: str) -> ExcelTracker:
+        """Get the tracker for a path, reusing it so its cached state persists"""
+        key = str(Path(excel_path))
+        if key not in self._trackers:
+            self._trackers[key] = ExcelTracker(key)
+        return self._trackers[key]
+    
     def _generate_scan_summary(self, applications: List[dict]) -> str:
         """Generate summary text for scan results"""
-        status_counts = {}
-        for app in applications:
-            status = app['status']
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = Counter(app['status'] for app in applications)
         
         summary = f"Successfully processed {len(applications)} job application emails:\n\n"
         for status, count in status_counts.items():
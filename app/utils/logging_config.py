@@ -3,17 +3,21 @@
 import logging
 from typing import Optional
 
-def setup_logging(level: Optional[str] = None) -> None:
-    """Setup logging configuration"""
+def setup_logging(level: Optional[str] = None, log_file: Optional[str] = None) -> None:
+    """Setup logging configuration
+    
+    Logs go to the console; pass log_file to also write them to disk.
+    """
     log_level = getattr(logging, (level or 'INFO').upper())
     
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    
     logging.basicConfig(
         level=log_level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('job_tracker.log')
-        ]
+        handlers=handlers
     )
 
 def get_logger(name: str) -> logging.Logger:
@@ -12,6 +12,7 @@ setup(
         "google-auth-httplib2>=0.2.0",
         "google-api-python-client>=2.0.0",
         "openpyxl>=3.1.0",
+        "orjson>=3.9.0",
         "python-dateutil>=2.8.0",
     ],
     entry_points={
@@ -0,0 +1,87 @@
+"""Tests for the email classifier's literal prescreen"""
+
+import re
+import unittest
+
+from job_application_tracker.classification.email_classifier import EmailClassifier, _required_literal
+from job_application_tracker.config.settings import Settings
+
+class RequiredLiteralTest(unittest.TestCase):
+    """Tests for _required_literal"""
+    
+    def test_plain_word(self):
+        self.assertEqual(_required_literal('unfortunately'), 'unfortunately')
+    
+    def test_longest_run_is_lowercased(self):
+        self.assertEqual(_required_literal(r'Job\s+Offer\s+Letter'), 'letter')
+    
+    def test_escapes_split_runs(self):
+        self.assertEqual(_required_literal(r'\bfoo\b'), 'foo')
+        self.assertEqual(_required_literal(r'\d+'), None)
+    
+    def test_quantifier_drops_last_letter(self):
+        self.assertEqual(_required_literal('abcd?e'), 'abc')
+        self.assertEqual(_required_literal('abcd*'), 'abc')
+        self.assertEqual(_required_literal('abcd{0,2}'), 'abc')
+        self.assertEqual(_required_literal('x*'), None)
+    
+    def test_multi_character_escapes_are_consumed(self):
+        self.assertEqual(_required_literal(r'\xfcber'), 'ber')
+        self.assertEqual(_required_literal(r'\u00fcber'), 'ber')
+        self.assertEqual(_required_literal(r'\U000000fcber'), 'ber')
+        self.assertEqual(_required_literal(r'\N{LATIN SMALL LETTER E}cole'), 'cole')
+        self.assertEqual(_required_literal(r'gr\xfc\xdfe'), 'gr')
+    
+    def test_plus_keeps_last_letter(self):
+        self.assertEqual(_required_literal('abc+'), 'abc')
+    
+    def test_groups_are_skipped(self):
+        self.assertEqual(_required_literal(r'(?:your\s+)?application'), 'application')
+        self.assertEqual(_required_literal('(abcdef)xy'), 'xy')
+    
+    def test_alternation_inside_group(self):
+        self.assertEqual(_required_literal(r'next\s+(?:step|round)'), 'next')
+    
+    def test_top_level_alternation(self):
+        self.assertEqual(_required_literal('offer|interview'), None)
+    
+    def test_character_classes_are_skipped(self):
+        self.assertEqual(_required_literal('[abc]de'), 'de')
+        self.assertEqual(_required_literal('[]abc]de'), 'de')
+        self.assertEqual(_required_literal('[^]abc]de'), 'de')
+        self.assertEqual(_required_literal('[(|)]de'), 'de')
+    
+    def test_escape_inside_character_class(self):
+        self.assertEqual(_required_literal(r'[\]abc]de'), None)
+        self.assertIsNotNone(re.search(r'[\]abc]de', ']de'))
+    
+    def test_default_patterns_contain_their_literal(self):
+        for patterns in Settings.EMAIL_PATTERNS.values():
+            for pattern in patterns:
+                literal = _required_literal(pattern)
+                self.assertIsNotNone(literal, pattern)
+                self.assertIn(literal, pattern.lower())
+
+class PrescreenTest(unittest.TestCase):
+    """Tests that the literal prescreen never rejects content the regexes match"""
+    
+    def setUp(self):
+        self.classifier = EmailClassifier()
+        self.patterns = {category: list(patterns) for category, patterns in Settings.EMAIL_PATTERNS.items()}
+    
+    def tearDown(self):
+        Settings.EMAIL_PATTERNS.clear()
+        Settings.EMAIL_PATTERNS.update(self.patterns)
+    
+    def test_hex_escape_pattern(self):
+        self.classifier.add_pattern('other', r'\xfcbernommen')
+        self.assertEqual(self.classifier.classify_email('Wir haben Sie übernommen'), 'other')
+    
+    def test_ignorecase_folds_to_ascii(self):
+        self.assertEqual(self.classifier.classify_email('Not ſelected for this poſition'), 'rejection')
+        self.assertEqual(self.classifier.classify_email('İNTERVİEW'), 'interview')
+        self.classifier.add_pattern('praise', 'kudos')
+        self.assertEqual(self.classifier.classify_email('\u212audos to the team'), 'praise')
+
+if __name__ == '__main__':
+    unittest.main()